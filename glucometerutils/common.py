@@ -32,6 +32,13 @@ class MeasurementMethod(enum.Enum):
     TIME = "time"
 
 
+# Glucose values in mg/dL are almost always whole numbers in a small range, so
+# precompute their mmol/L representation instead of dividing for each reading.
+_MG_DL_TO_MMOL_L: dict[float, float] = {
+    value: round(value / 18.0, 2) for value in range(1001)
+}
+
+
 def convert_glucose_unit(value: float, from_unit: Unit, to_unit: Unit) -> float:
     """Convert the given value of glucose level between units.
 
@@ -43,19 +50,24 @@ def convert_glucose_unit(value: float, from_unit: Unit, to_unit: Unit) -> float:
     Returns:
       The converted representation of the blood glucose level.
     """
-    from_unit = Unit(from_unit)
-    to_unit = Unit(to_unit)
+    if not isinstance(from_unit, Unit):
+        from_unit = Unit(from_unit)
+    if not isinstance(to_unit, Unit):
+        to_unit = Unit(to_unit)
 
     if from_unit == to_unit:
         return value
 
     if from_unit == Unit.MG_DL:
+        converted = _MG_DL_TO_MMOL_L.get(value)
+        if converted is not None:
+            return converted
         return round(value / 18.0, 2)
 
     return round(value * 18.0, 1)
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class GlucoseReading:
     timestamp: datetime.datetime
     value: float
@@ -73,20 +85,21 @@ class GlucoseReading:
         Args:
           to_unit: The unit to return the value to.
         """
+        # Values are always stored in mg/dL, so there is nothing to convert.
+        if to_unit is Unit.MG_DL:
+            return self.value
+
         return convert_glucose_unit(self.value, Unit.MG_DL, to_unit)
 
     def as_csv(self, unit: Unit) -> str:
         """Returns the reading as a formatted comma-separated value string."""
-        return '"%s","%.2f","%s","%s","%s"' % (
-            self.timestamp,
-            self.get_value_as(unit),
-            self.meal.value,
-            self.measure_method.value,
-            self.comment,
+        return (
+            f'"{self.timestamp}","{self.get_value_as(unit):.2f}",'
+            f'"{self.meal.value}","{self.measure_method.value}","{self.comment}"'
         )
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class KetoneReading:
     timestamp: datetime.datetime
     value: float
@@ -101,15 +114,13 @@ class KetoneReading:
         """Returns the reading as a formatted comma-separated value string."""
         del unit  # Unused for Ketone readings.
 
-        return '"%s","%.2f","","%s","%s"' % (
-            self.timestamp,
-            self.value,
-            self.measure_method.value,
-            self.comment,
+        return (
+            f'"{self.timestamp}","{self.value:.2f}","",'
+            f'"{self.measure_method.value}","{self.comment}"'
         )
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class TimeAdjustment:
     timestamp: datetime.datetime
     old_timestamp: datetime.datetime
@@ -120,17 +131,16 @@ class TimeAdjustment:
 
     def as_csv(self, unit: Unit) -> str:
         del unit
-        return '"%s","","","%s","%s"' % (
-            self.timestamp,
-            self.measure_method.value,
-            self.old_timestamp,
+        return (
+            f'"{self.timestamp}","","",'
+            f'"{self.measure_method.value}","{self.old_timestamp}"'
         )
 
 
 AnyReading = Union[GlucoseReading, KetoneReading, TimeAdjustment]
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class MeterInfo:
     """General information about the meter.
 
@@ -6,6 +6,7 @@
 import abc
 import dataclasses
 import datetime
+import functools
 import importlib
 import inspect
 from collections.abc import Generator
@@ -71,12 +72,13 @@ class GlucometerDevice(abc.ABC):
         pass
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(frozen=True)
 class Driver:
     device: type[GlucometerDevice]
     help: str
 
 
+@functools.lru_cache(maxsize=None)
 def load_driver(driver_name: str) -> Driver:
     driver_module = importlib.import_module(f"glucometerutils.drivers.{driver_name}")
     help_string = inspect.getdoc(driver_module)
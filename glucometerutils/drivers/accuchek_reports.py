@@ -17,7 +17,6 @@ The Accu-Chek Mobile meters should be set to "Reports" mode.
 
 import csv
 import datetime
-import glob
 import os
 from collections.abc import Generator
 from typing import NoReturn, Optional
@@ -41,10 +40,61 @@ _AFTER_MEAL_CSV_KEY = "After meal"
 # Control test has extra whitespace which is not ignored.
 _CONTROL_CSV_KEY = "Control test" + " " * 197
 
-_DATE_FORMAT = "%d.%m.%Y"
-_TIME_FORMAT = "%H:%M"
 
-_DATETIME_FORMAT = " ".join((_DATE_FORMAT, _TIME_FORMAT))
+def _parse_datetime(date: str, time: str) -> datetime.datetime:
+    """Parses the report's date (DD.MM.YYYY) and time (HH:MM) columns.
+
+    Only values that strptime() with "%d.%m.%Y %H:%M" would also accept are
+    parsed, but this is much faster for the fixed format used by the reports.
+
+    Raises:
+      ValueError: if the date or time are not in the expected format.
+    """
+    day, month, year = date.split(".")
+    hour, minute = time.split(":")
+    if not (
+        len(year) == 4
+        and year.isdigit()
+        and all(
+            1 <= len(field) <= 2 and field.isdigit()
+            for field in (day, month, hour, minute)
+        )
+    ):
+        raise ValueError(f"Invalid date and time: {date!r} {time!r}")
+    return datetime.datetime(int(year), int(month), int(day), int(hour), int(minute))
+
+
+def _find_report_file(device: str) -> Optional[str]:
+    """Returns the first $device/*/Reports/*.csv file, if any.
+
+    This matches what glob would find, but stops scanning the (possibly slow)
+    mounted filesystem as soon as a report is found.
+    """
+    try:
+        models = os.scandir(device)
+    except OSError:
+        return None
+
+    with models:
+        for model in models:
+            if model.name.startswith(".") or not model.is_dir():
+                continue
+
+            try:
+                reports = os.scandir(os.path.join(model.path, "Reports"))
+            except OSError:
+                continue
+
+            with reports:
+                for report in reports:
+                    if (
+                        report.name.endswith(".csv")
+                        and not report.name.startswith(".")
+                        and report.is_file()
+                    ):
+                        return report.path
+
+    return None
 
 
 class Device(driver.GlucometerDevice):
@@ -55,30 +105,48 @@ class Device(driver.GlucometerDevice):
                 "for the meter."
             )
 
-        reports_path = os.path.join(device, "*", "Reports", "*.csv")
-        report_files = glob.glob(reports_path)
-        if not report_files:
+        report_file = _find_report_file(device)
+        if report_file is None:
+            reports_path = os.path.join(device, "*", "Reports", "*.csv")
             raise exceptions.ConnectionFailed(
                 f'No report file found in path "{reports_path}".'
             )
 
-        self.report_file = report_files[0]
-
-    def _get_records_reader(self) -> csv.DictReader:
-        self.report.seek(0)
-        # Skip the first two lines
-        next(self.report)
-        next(self.report)
-
-        return csv.DictReader(
-            self.report, delimiter=";", skipinitialspace=True, quoting=csv.QUOTE_NONE
-        )
+        self.report_file = report_file
 
     def connect(self) -> None:
-        self.report = open(self.report_file, "r", newline="\r\n", encoding="utf-8")
-
-    def disconnect(self) -> None:
-        self.report.close()
+        # Reports are small, so parse the whole file in a single pass rather than
+        # seeking back to the start for each query.
+        with open(self.report_file, "r", newline="\r\n", encoding="utf-8") as report:
+            # ignore the first line.
+            next(report)
+            # The second line of the CSV is serial-no;report-date;report-time;;;;;;;
+            self._serial_number = next(report).split(";")[0]
+
+            reader = csv.reader(
+                report, delimiter=";", skipinitialspace=True, quoting=csv.QUOTE_NONE
+            )
+            header = next(reader)
+            # Access fields by position rather than building a dictionary for each
+            # record, resolving the column indices only once.
+            columns = {name: idx for idx, name in enumerate(header)}
+            self._date_idx = columns[_DATE_CSV_KEY]
+            self._time_idx = columns[_TIME_CSV_KEY]
+            self._result_idx = columns[_RESULT_CSV_KEY]
+            self._unit_idx = columns[_UNIT_CSV_KEY]
+            self._before_meal_idx = columns[_BEFORE_MEAL_CSV_KEY]
+            self._after_meal_idx = columns[_AFTER_MEAL_CSV_KEY]
+
+            # Records without a result are skipped; the trailing columns can be
+            # missing from the others, so pad them to the header's width.
+            width = len(header)
+            self._records = []
+            for record in reader:
+                if len(record) <= self._result_idx:
+                    continue
+                if len(record) < width:
+                    record.extend([""] * (width - len(record)))
+                self._records.append(record)
 
     def get_meter_info(self) -> common.MeterInfo:
         return common.MeterInfo(
@@ -92,16 +160,14 @@ class Device(driver.GlucometerDevice):
         return os.path.basename(os.path.dirname(os.path.dirname(self.report_file)))
 
     def get_serial_number(self) -> str:
-        self.report.seek(0)
-        # ignore the first line.
-        next(self.report)
-        # The second line of the CSV is serial-no;report-date;report-time;;;;;;;
-        return next(self.report).split(";")[0]
+        return self._serial_number
 
     def get_glucose_unit(self) -> common.Unit:
+        if not self._records:
+            raise exceptions.InvalidResponse("No records found in the report file.")
+
         # Get the first record available and parse that.
-        record = next(self._get_records_reader())
-        return _UNIT_MAP[record[_UNIT_CSV_KEY]]
+        return _UNIT_MAP[self._records[0][self._unit_idx]]
 
     def get_datetime(self) -> NoReturn:
         raise NotImplementedError
@@ -112,36 +178,28 @@ class Device(driver.GlucometerDevice):
     def zero_log(self) -> NoReturn:
         raise NotImplementedError
 
-    def _extract_datetime(
-        self, record: dict[str, str]
-    ) -> datetime.datetime:  # pylint: disable=no-self-use
-        # Date and time are in separate column, but we want to parse them
-        # together.
-        date_and_time = " ".join((record[_DATE_CSV_KEY], record[_TIME_CSV_KEY]))
-        return datetime.datetime.strptime(date_and_time, _DATETIME_FORMAT)
-
-    def _extract_meal(
-        self, record: dict[str, str]
-    ) -> common.Meal:  # pylint: disable=no-self-use
-        if record[_AFTER_MEAL_CSV_KEY] and record[_BEFORE_MEAL_CSV_KEY]:
+    def _extract_datetime(self, record: list[str]) -> datetime.datetime:
+        return _parse_datetime(record[self._date_idx], record[self._time_idx])
+
+    def _extract_meal(self, record: list[str]) -> common.Meal:
+        after_meal = record[self._after_meal_idx]
+        before_meal = record[self._before_meal_idx]
+        if after_meal and before_meal:
             raise exceptions.InvalidResponse("Reading cannot be before and after meal.")
-        elif record[_AFTER_MEAL_CSV_KEY]:
+        elif after_meal:
             return common.Meal.AFTER
-        elif record[_BEFORE_MEAL_CSV_KEY]:
+        elif before_meal:
             return common.Meal.BEFORE
         else:
             return common.Meal.NONE
 
     def get_readings(self) -> Generator[common.AnyReading, None, None]:
-        for record in self._get_records_reader():
-            if record[_RESULT_CSV_KEY] is None:
-                continue
-
+        for record in self._records:
             yield common.GlucoseReading(
                 self._extract_datetime(record),
                 common.convert_glucose_unit(
-                    float(record[_RESULT_CSV_KEY]),
-                    _UNIT_MAP[record[_UNIT_CSV_KEY]],
+                    float(record[self._result_idx]),
+                    _UNIT_MAP[record[self._unit_idx]],
                     common.Unit.MG_DL,
                 ),
                 meal=self._extract_meal(record),
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+#
+# SPDX-FileCopyrightText: © 2026 The glucometerutils Authors
+# SPDX-License-Identifier: MIT
+"""Tests for the Accu-Chek Mobile reports driver."""
+
+# pylint: disable=protected-access,missing-docstring
+
+import datetime
+import os
+import tempfile
+from unittest import mock
+
+from absl.testing import parameterized
+
+from glucometerutils import common, exceptions
+from glucometerutils.drivers import accuchek_reports
+
+
+def _touch(*path_components: str) -> str:
+    path = os.path.join(*path_components)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    open(path, "w").close()
+    return path
+
+
+_REPORT_HEADER = ";".join(
+    (
+        "Date",
+        "Time",
+        "Result",
+        "Unit",
+        "Temperature warning",
+        "Out of target range",
+        "Other",
+        "Before meal",
+        "After meal",
+        "Control test" + " " * 197,
+    )
+)
+
+
+def _write_report(device: str, *records: str) -> str:
+    path = _touch(device, "Mobile", "Reports", "report.csv")
+    lines = ("Report;;;;;;;;;", "SN12345;03.02.2020;10:00;;;;;;;", _REPORT_HEADER)
+    with open(path, "w", newline="", encoding="utf-8") as report:
+        report.write("".join(f"{line}\r\n" for line in lines + records))
+    return path
+
+
+class TestAccuChekReports(parameterized.TestCase):
+    @parameterized.parameters(
+        ("22.04.2014", "02:14", datetime.datetime(2014, 4, 22, 2, 14)),
+        ("10.07.2013", "14:26", datetime.datetime(2013, 7, 10, 14, 26)),
+        ("1.2.2020", "9:05", datetime.datetime(2020, 2, 1, 9, 5)),
+    )
+    def test_parse_datetime(self, date, time, expected):
+        self.assertEqual(accuchek_reports._parse_datetime(date, time), expected)
+
+    @parameterized.parameters(
+        ("22.04.2014", "02:14:37"),
+        ("2014-04-22", "02:14"),
+        ("31.02.2014", "02:14"),
+        ("22.04.2014", "25:14"),
+        ("22.04.14", "02:14"),
+        (" 22.04.2014", "02:14"),
+        ("+22.04.2014", "02:14"),
+        ("2_2.04.2014", "02:14"),
+        ("22.04.02014", "02:14"),
+        ("", ""),
+    )
+    def test_parse_datetime_invalid(self, date, time):
+        with self.assertRaises(ValueError):
+            accuchek_reports._parse_datetime(date, time)
+
+    def test_find_report_file(self):
+        with tempfile.TemporaryDirectory() as device:
+            _touch(device, ".hidden", "Reports", "hidden.csv")
+            _touch(device, "Mobile", "Reports", ".hidden.csv")
+            _touch(device, "Mobile", "Reports", "report.txt")
+            _touch(device, "Mobile", "Other", "other.csv")
+            expected = _touch(device, "Mobile", "Reports", "report.csv")
+
+            self.assertEqual(accuchek_reports._find_report_file(device), expected)
+            self.assertEqual(accuchek_reports.Device(device).report_file, expected)
+
+    def test_find_report_file_missing(self):
+        with tempfile.TemporaryDirectory() as device:
+            _touch(device, "Mobile", "Reports", "report.txt")
+            _touch(device, "stray.csv")
+
+            self.assertIsNone(accuchek_reports._find_report_file(device))
+            with self.assertRaises(exceptions.ConnectionFailed):
+                accuchek_reports.Device(device)
+
+    def test_find_report_file_unreadable(self):
+        with tempfile.TemporaryDirectory() as device:
+            _touch(device, "Mobile", "Reports", "report.csv")
+
+            with mock.patch.object(os, "scandir", side_effect=PermissionError):
+                self.assertIsNone(accuchek_reports._find_report_file(device))
+                with self.assertRaises(exceptions.ConnectionFailed):
+                    accuchek_reports.Device(device)
+
+    def test_readings(self):
+        with tempfile.TemporaryDirectory() as device:
+            _write_report(
+                device,
+                "01.02.2020;08:15;5.3;mmol/l;;;;X;;",
+                "01.02.2020;12:30;7.1;mmol/l;;X;;;X;",
+                # Trailing columns missing.
+                "05.02.2020;11:00;6.2;mmol/l;;;;X",
+                "",
+                # No result at all.
+                "06.02.2020;10:00",
+                "07.02.2020;9:05;4.9;mmol/l;;;;;;",
+            )
+
+            meter = accuchek_reports.Device(device)
+            meter.connect()
+
+            self.assertEqual(meter.get_serial_number(), "SN12345")
+            self.assertEqual(meter.get_glucose_unit(), common.Unit.MMOL_L)
+            self.assertEqual(
+                list(meter.get_readings()),
+                [
+                    common.GlucoseReading(
+                        datetime.datetime(2020, 2, 1, 8, 15),
+                        95.4,
+                        meal=common.Meal.BEFORE,
+                    ),
+                    common.GlucoseReading(
+                        datetime.datetime(2020, 2, 1, 12, 30),
+                        127.8,
+                        meal=common.Meal.AFTER,
+                    ),
+                    common.GlucoseReading(
+                        datetime.datetime(2020, 2, 5, 11, 0),
+                        111.6,
+                        meal=common.Meal.BEFORE,
+                    ),
+                    common.GlucoseReading(datetime.datetime(2020, 2, 7, 9, 5), 88.2),
+                ],
+            )
+
+    def test_glucose_unit_no_records(self):
+        with tempfile.TemporaryDirectory() as device:
+            _write_report(device, "06.02.2020;10:00", "")
+
+            meter = accuchek_reports.Device(device)
+            meter.connect()
+
+            self.assertEqual(list(meter.get_readings()), [])
+            with self.assertRaises(exceptions.InvalidResponse):
+                meter.get_glucose_unit()
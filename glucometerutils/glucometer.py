@@ -6,16 +6,23 @@
 """Utility to manage glucometers' data."""
 
 import argparse
+import functools
 import logging
+import operator
 import sys
+from collections.abc import Callable
 
 from glucometerutils import common, driver, exceptions
 
+_CONFIRM_ANSWERS = frozenset({"y", "ye", "yes"})
 
-def main():
-    if sys.version_info < (3, 7):
-        raise Exception("Unsupported Python version, please use at least Python 3.7")
+_ActionHandler = Callable[
+    [argparse.Namespace, driver.GlucometerDevice, common.MeterInfo], int
+]
 
+
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser()
     subparsers = parser.add_subparsers(dest="action")
 
@@ -94,7 +101,133 @@ def main():
         help="Set the patient name, if the meter supports it.",
     )
 
-    args = parser.parse_args()
+    return parser
+
+
+def _action_info(
+    args: argparse.Namespace,
+    device: driver.GlucometerDevice,
+    device_info: common.MeterInfo,
+) -> int:
+    del args  # Unused for the info action.
+
+    try:
+        time_str = str(device.get_datetime())
+    except exceptions.InvalidDateTime:
+        time_str = "INVALID"
+    # Also catch any leftover ValueErrors.
+    except (NotImplementedError, ValueError):
+        time_str = "N/A"
+    print(f"{device_info}Time: {time_str}")
+    return 0
+
+
+def _action_dump(
+    args: argparse.Namespace,
+    device: driver.GlucometerDevice,
+    device_info: common.MeterInfo,
+) -> int:
+    if args.unit is None:
+        unit = device_info.native_unit
+    else:
+        unit = common.Unit(args.unit)
+
+    readings = device.get_readings()
+
+    if not args.with_ketone:
+        readings = (
+            reading
+            for reading in readings
+            if not isinstance(reading, common.KetoneReading)
+        )
+
+    sys.stdout.writelines(
+        f"{reading.as_csv(unit)}\n"
+        for reading in sorted(readings, key=operator.attrgetter("timestamp"))
+    )
+    return 0
+
+
+def _action_datetime(
+    args: argparse.Namespace,
+    device: driver.GlucometerDevice,
+    device_info: common.MeterInfo,
+) -> int:
+    del device_info  # Unused for the datetime action.
+
+    if args.set == "now":
+        print(device.set_datetime())
+    elif args.set:
+        try:
+            from dateutil import parser as date_parser
+
+            new_date = date_parser.parse(args.set)
+        except ImportError:
+            logging.error('Unable to import module "dateutil", please install it.')
+            return 1
+        except ValueError:
+            logging.error("%s: not a valid date", args.set)
+            return 1
+        print(device.set_datetime(new_date))
+    else:
+        print(device.get_datetime())
+    return 0
+
+
+def _action_patient(
+    args: argparse.Namespace,
+    device: driver.GlucometerDevice,
+    device_info: common.MeterInfo,
+) -> int:
+    del device_info  # Unused for the patient action.
+
+    if args.set_name is not None:
+        try:
+            # Patient name support is optional, and not part of GlucometerDevice.
+            device.set_patient_name(args.set_name)  # type: ignore[attr-defined]
+        except NotImplementedError:
+            print("The glucometer does not support setting patient name.")
+    try:
+        patient_name = device.get_patient_name()  # type: ignore[attr-defined]
+        if patient_name is None:
+            patient_name = "[N/A]"
+        print(f"Patient Name: {patient_name}")
+    except NotImplementedError:
+        print("The glucometer does not support retrieving patient name.")
+    return 0
+
+
+def _action_zero(
+    args: argparse.Namespace,
+    device: driver.GlucometerDevice,
+    device_info: common.MeterInfo,
+) -> int:
+    del args, device_info  # Unused for the zero action.
+
+    confirm = input("Delete the device data log? (y/N) ")
+    if confirm.strip().lower() in _CONFIRM_ANSWERS:
+        device.zero_log()
+        print("\nDevice data log zeroed.")
+        return 0
+
+    print("\nDevice data log not zeroed.")
+    return 1
+
+
+_ACTIONS: dict[str, _ActionHandler] = {
+    "info": _action_info,
+    "dump": _action_dump,
+    "datetime": _action_datetime,
+    "patient": _action_patient,
+    "zero": _action_zero,
+}
+
+
+def main():
+    if sys.version_info < (3, 7):
+        raise Exception("Unsupported Python version, please use at least Python 3.7")
+
+    args = _build_parser().parse_args()
 
     logging.basicConfig(level=args.vlog)
 
@@ -120,77 +253,18 @@ def main():
     device.connect()
     device_info = device.get_meter_info()
 
+    action = _ACTIONS.get(args.action)
+    if action is None:
+        return 1
+
     try:
-        if args.action == "info":
-            try:
-                time_str = device.get_datetime()
-            except exceptions.InvalidDateTime:
-                time_str = "INVALID"
-            # Also catch any leftover ValueErrors.
-            except (NotImplementedError, ValueError):
-                time_str = "N/A"
-            print(f"{device_info}Time: {time_str}")
-        elif args.action == "dump":
-            unit = args.unit
-            if unit is None:
-                unit = device_info.native_unit
-
-            readings = device.get_readings()
-
-            if not args.with_ketone:
-                readings = (
-                    reading
-                    for reading in readings
-                    if not isinstance(reading, common.KetoneReading)
-                )
-
-            for reading in sorted(readings, key=lambda r: r.timestamp):
-                print(reading.as_csv(unit))
-        elif args.action == "datetime":
-            if args.set == "now":
-                print(device.set_datetime())
-            elif args.set:
-                try:
-                    from dateutil import parser as date_parser
-
-                    new_date = date_parser.parse(args.set)
-                except ImportError:
-                    logging.error(
-                        'Unable to import module "dateutil", please install it.'
-                    )
-                    return 1
-                except ValueError:
-                    logging.error("%s: not a valid date", args.set)
-                    return 1
-                print(device.set_datetime(new_date))
-            else:
-                print(device.get_datetime())
-        elif args.action == "patient":
-            if args.set_name is not None:
-                try:
-                    device.set_patient_name(args.set_name)
-                except NotImplementedError:
-                    print("The glucometer does not support setting patient name.")
-            try:
-                patient_name = device.get_patient_name()
-                if patient_name is None:
-                    patient_name = "[N/A]"
-                print(f"Patient Name: {patient_name}")
-            except NotImplementedError:
-                print("The glucometer does not support retrieving patient name.")
-        elif args.action == "zero":
-            confirm = input("Delete the device data log? (y/N) ")
-            if confirm.lower() in ["y", "ye", "yes"]:
-                device.zero_log()
-                print("\nDevice data log zeroed.")
-            else:
-                print("\nDevice data log not zeroed.")
-                return 1
-        else:
-            return 1
+        result = action(args, device, device_info)
     except exceptions.Error as err:
         print(f"Error while executing '{args.action}': {err}")
         return 1
 
+    if result:
+        return result
+
     device.disconnect()
     return 0
@@ -26,6 +26,21 @@ class TestGlucoseConversion(parameterized.TestCase):
             common.convert_glucose_unit(100, common.Unit.MG_DL, common.Unit.MMOL_L),
         )
 
+    @parameterized.parameters(
+        (0, 0.0),
+        (100, 5.56),
+        (100.0, 5.56),
+        (1000, 55.56),
+        (1001, 55.61),
+        (100.5, 5.58),
+        (-18, -1.0),
+    )
+    def test_convert_to_mmol_precomputed(self, value, expected):
+        self.assertEqual(
+            expected,
+            common.convert_glucose_unit(value, common.Unit.MG_DL, common.Unit.MMOL_L),
+        )
+
     def test_convert_to_mgdl(self):
         self.assertEqual(
             180, common.convert_glucose_unit(10, common.Unit.MMOL_L, common.Unit.MG_DL)